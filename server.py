@@ -5,11 +5,921 @@ import numpy as np
 from typing import Any, List
 from mcp.server.fastmcp import FastMCP
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from operator import eq, ge, gt, le, lt, ne
 import csv
+import tempfile
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pacsv = pq = None
+
+try:
+    from tdigest import TDigest
+except ImportError:
+    TDigest = None
 
 # Initialize FastMCP server
 mcp = FastMCP("csv-analyzer")
 
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+# Cells pandas reads as missing by default; handed to the Polars, pyarrow and
+# DuckDB readers so every parse path agrees on what counts as null
+_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+]
+
+# pandas merge types Polars can run, in Polars' spelling; others go to pandas
+_POLARS_JOIN_TYPES = {'inner': 'inner', 'left': 'left', 'right': 'right', 'outer': 'full'}
+
+# merge_csvs joins inputs this large (combined) with DuckDB when installed
+_DUCKDB_MERGE_BYTES = 100 * 1024 * 1024
+_DUCKDB_JOIN_TYPES = {'inner': 'INNER', 'left': 'LEFT', 'right': 'RIGHT', 'outer': 'FULL OUTER'}
+
+# Chunk size for raw CSV scans and buffer size for buffered CSV writes
+_SCAN_CHUNK_BYTES = 4 << 20
+_IO_BUFFER_BYTES = 1 << 20
+
+# Block size pyarrow's CSV reader hands to each parsing thread
+_ARROW_BLOCK_BYTES = 8 << 20
+
+# Threads list_csv_files uses to inspect files concurrently
+_LIST_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# filter_csv comparison operators
+_FILTER_OPERATORS = {'==': eq, '!=': ne, '>': gt, '<': lt, '>=': ge, '<=': le}
+
+# analyze_csv streams files larger than this instead of loading them whole
+_CHUNKED_ANALYSIS_BYTES = 100 * 1024 * 1024
+_ANALYSIS_CHUNK_ROWS = 500_000
+
+# Quantile points per chunk fed into each column's t-digest
+_DIGEST_POINTS = 1000
+
+# CSVs at least this large get a Parquet copy beside them for repeat reads
+_PARQUET_CACHE_MIN_BYTES = 1024 * 1024
+_PARQUET_CACHE_KEY = b'csv_source'
+
+
+def _arrow_read_csv(path: Path):
+    """
+    Parse a CSV into an Arrow table through a memory map
+    
+    The OS pages the file in behind pyarrow's multi-threaded tokenizer, with
+    no copy into a user-space read buffer.
+    
+    Args:
+        path: Path to the CSV file
+    
+    Returns:
+        pyarrow Table
+    """
+    read_options = pacsv.ReadOptions(block_size=_ARROW_BLOCK_BYTES)
+    convert_options = pacsv.ConvertOptions(null_values=_NA_VALUES, strings_can_be_null=True)
+    with pa.memory_map(str(path)) as source:
+        return pacsv.read_csv(source, read_options=read_options, convert_options=convert_options)
+
+
+def _parquet_cache(path: Path) -> Path:
+    """
+    Return an up-to-date Parquet copy of a CSV, writing it on first use
+    
+    The copy sits beside the CSV as <stem>.parquet.cache and is rebuilt when
+    the CSV's name, mtime or size no longer match the ones stored in its
+    metadata.
+    
+    Args:
+        path: Path to the CSV file
+    
+    Returns:
+        Path to the Parquet file, or None if the CSV is small, pyarrow is not
+        installed, or the cache cannot be written
+    """
+    if pq is None:
+        return None
+    
+    stat = path.stat()
+    if stat.st_size < _PARQUET_CACHE_MIN_BYTES:
+        return None
+    
+    cache_path = path.with_suffix('.parquet.cache')
+    source = f'{path.name}:{stat.st_mtime_ns}:{stat.st_size}'.encode('utf-8')
+    try:
+        if cache_path.exists():
+            metadata = pq.read_schema(cache_path).metadata or {}
+            if metadata.get(_PARQUET_CACHE_KEY) == source:
+                return cache_path
+        
+        if pl is not None:
+            table = pl.read_csv(path, infer_schema_length=None, null_values=_NA_VALUES).to_arrow()
+        else:
+            table = _arrow_read_csv(path)
+        table = table.replace_schema_metadata({_PARQUET_CACHE_KEY: source})
+        
+        # Write under a unique temporary name so readers never see a partial
+        # file and concurrent writers don't clobber each other
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix='.tmp')
+        os.close(fd)
+        try:
+            pq.write_table(table, tmp_path, compression='zstd')
+            os.replace(tmp_path, cache_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+    except (OSError, pa.ArrowException):
+        return None
+    
+    return cache_path
+
+
+def _read_csv(path: Path, nrows: int = None) -> pd.DataFrame:
+    """
+    Read a CSV file into a pandas DataFrame, parsing with Polars when installed
+    
+    Args:
+        path: Path to the CSV file
+        nrows: Maximum number of rows to read (default: all rows)
+    
+    Returns:
+        pandas DataFrame with the CSV contents
+    """
+    if nrows is None:
+        cache_path = _parquet_cache(path)
+        if cache_path is not None:
+            table = pq.read_table(cache_path)
+            return table.to_pandas(self_destruct=True, split_blocks=True, types_mapper=pd.ArrowDtype)
+    
+    if pl is None:
+        # pyarrow's reader is multi-threaded but cannot stop after nrows
+        if nrows is None and pacsv is not None:
+            try:
+                table = _arrow_read_csv(path)
+                return table.to_pandas(self_destruct=True, split_blocks=True, types_mapper=pd.ArrowDtype)
+            except pa.ArrowInvalid:
+                pass
+        return pd.read_csv(path, nrows=nrows, engine='c', low_memory=False, cache_dates=True)
+    
+    # Infer types from every row returned so late values don't break the
+    # parse. Polars tokenizes a little past n_rows, so a preview whose later
+    # rows don't fit the inferred types falls back to pandas.
+    try:
+        df = pl.read_csv(path, n_rows=nrows, infer_schema_length=nrows, null_values=_NA_VALUES)
+    except pl.exceptions.ComputeError:
+        if nrows is None:
+            raise
+        return pd.read_csv(path, nrows=nrows, engine='c', low_memory=False, cache_dates=True)
+    return _pl_to_pandas(df)
+
+
+def _pl_to_pandas(df) -> pd.DataFrame:
+    """
+    Convert a Polars DataFrame to pandas through Arrow
+    
+    With pyarrow installed the pandas columns are ArrowDtype-backed and share
+    the Arrow buffers, avoiding the copy (and memory peak) of the default
+    numpy conversion.
+    
+    Args:
+        df: Polars DataFrame to convert
+    
+    Returns:
+        pandas DataFrame
+    """
+    if pa is None:
+        return df.to_pandas()
+    return df.to_arrow().to_pandas(self_destruct=True, split_blocks=True, types_mapper=pd.ArrowDtype)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize pandas missing values as null and other unknown scalars via str()"""
+    if obj is pd.NA or obj is pd.NaT:
+        return None
+    return str(obj)
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Serialize a tool result as indented JSON, using orjson when installed
+    
+    Args:
+        obj: JSON-compatible object (numpy scalars and arrays are allowed)
+    
+    Returns:
+        JSON string
+    """
+    if orjson is None:
+        return json.dumps(obj, indent=2, default=_json_default)
+    
+    option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    return orjson.dumps(obj, default=_json_default, option=option).decode('utf-8')
+
+
+def _records(df: pd.DataFrame) -> List[dict]:
+    """
+    Convert a DataFrame to a list of row dicts, like df.to_dict(orient='records')
+    
+    Args:
+        df: pandas DataFrame to convert
+    
+    Returns:
+        List with one {column: value} dict per row
+    """
+    columns = df.columns.tolist()
+    return [dict(zip(columns, row)) for row in df.itertuples(index=False, name=None)]
+
+
+def _walk_csv(root: str):
+    """
+    Recursively yield the directory entries of every CSV under a directory
+    
+    Symlinked directories are not followed and unreadable ones are skipped.
+    
+    Args:
+        root: Directory path to search
+    
+    Returns:
+        Generator of os.DirEntry objects for *.csv files
+    """
+    try:
+        with os.scandir(root) as entries:
+            entries = list(entries)
+    except OSError:
+        return
+    
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_csv(entry.path)
+        elif entry.name.endswith('.csv') and entry.is_file():
+            yield entry
+
+
+def _inspect_csv(entry: os.DirEntry) -> dict:
+    """
+    Collect the list_csv_files entry for a single CSV
+    
+    Args:
+        entry: Directory entry of the CSV file
+    
+    Returns:
+        Dict with name, path, size, row/column counts and mtime, or an error
+    """
+    try:
+        # Get basic file info; DirEntry caches the stat result
+        stat = entry.stat()
+        
+        # Peek at first row for column count and count rows (approximate)
+        first_row, line_count = _count_rows(entry.path)
+        col_count = len(first_row) if first_row else 0
+        row_count = line_count - 1  # Subtract header
+        
+        return {
+            'name': entry.name,
+            'path': entry.path,
+            'size_mb': round(stat.st_size / (1024 * 1024), 2),
+            'rows': row_count,
+            'columns': col_count,
+            'modified': stat.st_mtime
+        }
+    except Exception as e:
+        return {
+            'name': entry.name,
+            'path': entry.path,
+            'error': str(e)
+        }
+
+
+def _count_rows(path: Path) -> tuple:
+    """
+    Read a CSV once, returning its first row and its line count
+    
+    Args:
+        path: Path to the CSV file
+    
+    Returns:
+        Tuple of (first row as a list or None, number of lines)
+    """
+    header = b''
+    have_header = False
+    lines = 0
+    last = b''
+    with open(path, 'rb', buffering=0) as f:
+        while chunk := f.read(_SCAN_CHUNK_BYTES):
+            if not have_header:
+                end = chunk.find(b'\n')
+                header += chunk if end < 0 else chunk[:end]
+                have_header = end >= 0
+            lines += chunk.count(b'\n')
+            last = chunk[-1:]
+    
+    # A final line without a trailing newline still counts
+    if last and last != b'\n':
+        lines += 1
+    
+    if not lines:
+        return None, 0
+    
+    if header.count(b'"') % 2:
+        # A quoted field spans lines, so the first line isn't a whole record
+        with open(path, encoding='utf-8', newline='') as f:
+            return next(csv.reader(f), None), lines
+    
+    first_row = next(csv.reader([header.decode('utf-8').rstrip('\r')]), None)
+    return first_row, lines
+
+
+def _write_rows(path: Path, rows: List[List[Any]], width: int, header: List[Any] = None,
+                mode: str = 'w') -> None:
+    """
+    Write rows straight to a CSV file with the stdlib csv writer
+    
+    Args:
+        path: Path to the CSV file
+        rows: 2D list of values; short rows are padded with empty values
+        width: Number of columns in the file
+        header: Optional header row to write first
+        mode: File mode, 'w' to overwrite or 'a' to append
+    
+    Raises:
+        ValueError: If a row has more values than the file has columns
+    """
+    for row in rows:
+        if len(row) > width:
+            raise ValueError(f'{width} columns expected, but a row has {len(row)} values')
+    
+    with open(path, mode, encoding='utf-8', newline='', buffering=_IO_BUFFER_BYTES) as f:
+        writer = csv.writer(f, lineterminator='\n')
+        if header is not None:
+            writer.writerow(header)
+        writer.writerows(row if len(row) == width else [*row, *[''] * (width - len(row))] for row in rows)
+
+
+def _merge_duckdb(path1: Path, path2: Path, output: Path, on: str, how: str) -> tuple:
+    """
+    Join two CSVs with DuckDB and stream the result to a CSV file
+    
+    DuckDB runs a multi-threaded hash join over the files directly, so neither
+    input is loaded into Python. Columns and rows follow pd.merge: the left
+    columns, then the right ones, with '_x'/'_y' on shared non-key names; rows
+    in the driving side's file order (the right file for a right join), or
+    sorted by key for an outer join.
+    
+    Args:
+        path1: Path to first CSV file
+        path2: Path to second CSV file
+        output: Path for merged output file
+        on: Column name to merge on, or None for all shared columns
+        how: Type of merge (inner, outer, left, right)
+    
+    Returns:
+        Tuple of (file1 rows, file2 rows, merged rows)
+    """
+    def quote_name(name):
+        return '"' + name.replace('"', '""') + '"'
+    
+    def quote_string(value):
+        return "'" + value.replace("'", "''") + "'"
+    
+    nullstr = '[' + ', '.join(quote_string(value) for value in _NA_VALUES) + ']'
+    
+    con = duckdb.connect()
+    try:
+        def source(path):
+            # Infer types from every row once, then pin them so later scans
+            # only sniff the dialect and late values can't break the parse
+            options = f'{quote_string(str(path))}, nullstr={nullstr}'
+            described = con.execute(
+                f'DESCRIBE SELECT * FROM read_csv_auto({options}, sample_size=-1)'
+            ).fetchall()
+            types = ', '.join(f'{quote_string(row[0])}: {quote_string(row[1])}' for row in described)
+            return f'read_csv_auto({options}, types={{{types}}})', [row[0] for row in described]
+        
+        source1, columns1 = source(path1)
+        source2, columns2 = source(path2)
+        
+        # Like pd.merge, default to joining on the shared columns
+        keys = [on] if on else [col for col in columns1 if col in columns2]
+        if not keys:
+            raise ValueError('No common columns to perform merge on')
+        
+        overlap = [col for col in columns1 if col in columns2 and col not in keys]
+        select = [quote_name(col) if col in keys else
+                  f'a.{quote_name(col)} AS {quote_name(col + "_x" if col in overlap else col)}'
+                  for col in columns1]
+        select += [f'b.{quote_name(col)} AS {quote_name(col + "_y" if col in overlap else col)}'
+                   for col in columns2 if col not in keys]
+        
+        # Number each side's rows in file order; the hash join itself doesn't
+        # keep any order, so the result is sorted the way pd.merge emits it
+        ordered1 = f'(SELECT *, row_number() OVER () AS __row FROM {source1})'
+        ordered2 = f'(SELECT *, row_number() OVER () AS __row FROM {source2})'
+        row_order = 'b.__row, a.__row' if how == 'right' else 'a.__row, b.__row'
+        
+        key_list = ', '.join(quote_name(key) for key in keys)
+        query = (f'SELECT {", ".join(select)} FROM {ordered1} a '
+                 f'{_DUCKDB_JOIN_TYPES[how]} JOIN {ordered2} b USING ({key_list})')
+        if how == 'outer':
+            # pd.merge sorts outer join keys lexicographically
+            query += f' ORDER BY {key_list} NULLS LAST, {row_order}'
+        else:
+            query += f' ORDER BY {row_order}'
+        merged_rows = con.execute(
+            f'COPY ({query}) TO {quote_string(str(output))} (FORMAT CSV, HEADER)'
+        ).fetchone()[0]
+        file1_rows = con.execute(f'SELECT count(*) FROM {source1}').fetchone()[0]
+        file2_rows = con.execute(f'SELECT count(*) FROM {source2}').fetchone()[0]
+    finally:
+        con.close()
+    
+    return file1_rows, file2_rows, merged_rows
+
+
+def _keyword_matcher(keywords: List[str]):
+    """
+    Build a function that finds which keywords occur in a lowercased string
+    
+    Uses a single Aho-Corasick automaton when pyahocorasick is installed, so
+    each string is scanned once regardless of how many keywords there are.
+    
+    Args:
+        keywords: Distinct lowercased keywords
+    
+    Returns:
+        Function mapping a string to the collection of keywords found in it
+    """
+    if ahocorasick is None:
+        return lambda text: [kw for kw in keywords if kw in text]
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return lambda text: {keyword for _, keyword in automaton.iter(text)}
+
+
+def _is_categorical(series: pd.Series) -> bool:
+    """Whether analyze_csv reports value counts for a column"""
+    return (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)
+            or isinstance(series.dtype, pd.CategoricalDtype))
+
+
+def _numeric_summary(series: pd.Series) -> tuple:
+    """
+    Compute analyze_csv's statistics and IQR outlier count for a numeric column
+    
+    numpy-backed columns are handled as one float array of their non-null
+    values: the quartiles (linearly interpolated, as pandas does) come from a
+    single np.partition call rather than a sort per quantile.
+    
+    Args:
+        series: Numeric pandas Series
+    
+    Returns:
+        Tuple of (statistics dict, outlier count)
+    """
+    if not isinstance(series.dtype, np.dtype):
+        # Arrow-backed columns already run these in Arrow compute kernels,
+        # which beat a conversion to numpy
+        desc = series.describe(percentiles=[0.25, 0.5, 0.75])
+        statistics = {
+            'mean': float(desc['mean']) if not pd.isna(desc['mean']) else None,
+            'median': float(desc['50%']) if not pd.isna(desc['50%']) else None,
+            'std': float(desc['std']) if not pd.isna(desc['std']) else None,
+            'min': float(desc['min']) if not pd.isna(desc['min']) else None,
+            'max': float(desc['max']) if not pd.isna(desc['max']) else None,
+            'q25': float(desc['25%']) if not pd.isna(desc['25%']) else None,
+            'q75': float(desc['75%']) if not pd.isna(desc['75%']) else None
+        }
+        
+        # Outlier detection
+        iqr = desc['75%'] - desc['25%']
+        outliers = int(((series < desc['25%'] - 1.5 * iqr) | (series > desc['75%'] + 1.5 * iqr)).sum())
+        return statistics, outliers
+    
+    values = series.to_numpy(dtype=float, na_value=np.nan)
+    values = values[~np.isnan(values)]
+    n = values.size
+    if not n:
+        return dict.fromkeys(['mean', 'median', 'std', 'min', 'max', 'q25', 'q75']), 0
+    
+    positions = np.array([0.25, 0.5, 0.75]) * (n - 1)
+    lower = np.floor(positions).astype(int)
+    part = np.partition(values, np.unique(lower))
+    
+    # Everything after a partition point is >= it, so the next order
+    # statistic is the minimum of that tail; no second partition point needed
+    quartiles = []
+    for position, index in zip(positions, lower):
+        quantile = part[index]
+        if position > index:
+            quantile += (part[index + 1:].min() - quantile) * (position - index)
+        quartiles.append(quantile)
+    q25, median, q75 = quartiles
+    
+    statistics = {
+        'mean': float(values.mean()),
+        'median': float(median),
+        'std': float(values.std(ddof=1)) if n > 1 else None,
+        'min': float(part.min()),
+        'max': float(part.max()),
+        'q25': float(q25),
+        'q75': float(q75)
+    }
+    
+    # Outlier detection
+    iqr = q75 - q25
+    outliers = int(np.count_nonzero((values < q25 - 1.5 * iqr) | (values > q75 + 1.5 * iqr)))
+    return statistics, outliers
+
+
+def _count_duplicates(df: pd.DataFrame) -> int:
+    """
+    Count rows that repeat an earlier row, like df.duplicated().sum()
+    
+    Uses Polars' multi-threaded n_unique when installed; Arrow-backed columns
+    are handed over without a copy.
+    
+    Args:
+        df: pandas DataFrame to check
+    
+    Returns:
+        Number of duplicate rows
+    """
+    if pl is not None and df.columns.is_unique and len(df.columns):
+        try:
+            return len(df) - pl.from_pandas(df).n_unique()
+        except (TypeError, ValueError, pl.exceptions.PolarsError):
+            pass
+    return int(df.duplicated().sum())
+
+
+def _csv_dtypes(path: Path) -> dict:
+    """
+    Infer the pandas dtype _read_csv would give each column, without loading the file
+    
+    Polars infers the schema from every row of a lazy scan. Without Polars the
+    file is streamed once as strings and each column classified as integer,
+    float, boolean or string, then mapped to the dtypes pyarrow's reader (or
+    pd.read_csv, when pyarrow is missing too) would produce.
+    
+    Args:
+        path: Path to the CSV file
+    
+    Returns:
+        Dict mapping column name to pandas dtype
+    """
+    if pl is not None:
+        schema = pl.scan_csv(path, infer_schema_length=None, null_values=_NA_VALUES).collect_schema()
+        return _pl_to_pandas(pl.DataFrame(schema=schema)).dtypes.to_dict()
+    
+    kinds = {}
+    has_nulls = {}
+    for chunk in pd.read_csv(path, chunksize=_ANALYSIS_CHUNK_ROWS, dtype=object, low_memory=False):
+        for col in chunk.columns:
+            values = chunk[col].dropna()
+            has_nulls[col] = has_nulls.get(col, False) or len(values) < len(chunk)
+            if not len(values):
+                kind = None
+            elif values.str.fullmatch(r'[+-]?\d+').all():
+                kind = 'int'
+            elif pd.to_numeric(values, errors='coerce').notna().all():
+                kind = 'float'
+            elif values.isin(['True', 'TRUE', 'true', 'False', 'FALSE', 'false']).all():
+                kind = 'bool'
+            else:
+                kind = 'str'
+            
+            # A column keeps the widest kind seen: int widens to float, any
+            # other mix falls back to string
+            seen = kinds.get(col)
+            if seen is None or kind is None or seen == kind:
+                kinds[col] = seen or kind
+            elif {seen, kind} == {'int', 'float'}:
+                kinds[col] = 'float'
+            else:
+                kinds[col] = 'str'
+    
+    dtypes = {}
+    for col, kind in kinds.items():
+        if pa is not None:
+            arrow_types = {None: pa.null(), 'int': pa.int64(), 'float': pa.float64(),
+                           'bool': pa.bool_(), 'str': pa.string()}
+            dtypes[col] = pd.ArrowDtype(arrow_types[kind])
+        elif kind is None or kind == 'float' or (kind == 'int' and has_nulls[col]):
+            dtypes[col] = np.dtype('float64')
+        elif kind == 'int':
+            dtypes[col] = np.dtype('int64')
+        elif kind == 'bool' and not has_nulls[col]:
+            dtypes[col] = np.dtype('bool')
+        else:
+            dtypes[col] = pd.Series(dtype=str).dtype
+    return dtypes
+
+
+def _analyze_chunked(path: Path) -> dict:
+    """
+    Build the analyze_csv report in one streaming pass over a large CSV
+    
+    Numeric columns keep running moments plus a t-digest, so quantiles and
+    outlier counts are estimates; memory stays bounded by the chunk size.
+    Column types come from a first pass over the whole file, so they match
+    the in-memory report even when a column's values change type late.
+    
+    Args:
+        path: Path to the CSV file
+    
+    Returns:
+        Analysis dict with the same layout as analyze_csv
+    """
+    rows = 0
+    columns = {}
+    row_hashes = []
+    
+    read_dtypes = {}
+    for col, dtype in _csv_dtypes(path).items():
+        empty = pd.Series(dtype=dtype)
+        acc = columns[col] = {
+            'dtype': dtype,
+            'nulls': 0,
+            'numeric': pd.api.types.is_numeric_dtype(empty),
+            'categorical': _is_categorical(empty)
+        }
+        if acc['numeric']:
+            acc.update(count=0, mean=0.0, m2=0.0, min=np.inf, max=-np.inf, digest=TDigest())
+            read_dtypes[col] = 'boolean' if pd.api.types.is_bool_dtype(empty) else 'float64'
+        else:
+            if acc['categorical']:
+                acc['counts'] = pd.Series(dtype='int64')
+            read_dtypes[col] = object
+    
+    for chunk in pd.read_csv(path, chunksize=_ANALYSIS_CHUNK_ROWS, dtype=read_dtypes, low_memory=False):
+        rows += len(chunk)
+        row_hashes.append(pd.util.hash_pandas_object(chunk, index=False).to_numpy())
+        
+        for col in chunk.columns:
+            series = chunk[col]
+            acc = columns[col]
+            acc['nulls'] += int(series.isna().sum())
+            
+            if acc['numeric']:
+                values = series.to_numpy(dtype=float, na_value=np.nan)
+                values = values[~np.isnan(values)]
+                if not values.size:
+                    continue
+                
+                # Merge this chunk's moments into the running ones (Chan et al.)
+                n = acc['count'] + values.size
+                chunk_mean = values.mean()
+                delta = chunk_mean - acc['mean']
+                acc['m2'] += ((values - chunk_mean) ** 2).sum() + delta ** 2 * acc['count'] * values.size / n
+                acc['mean'] += delta * values.size / n
+                acc['count'] = n
+                acc['min'] = min(acc['min'], values.min())
+                acc['max'] = max(acc['max'], values.max())
+                
+                # Summarize the chunk by evenly spaced quantiles before digesting it
+                points = values
+                if values.size > _DIGEST_POINTS:
+                    points = np.quantile(values, np.linspace(0, 1, _DIGEST_POINTS))
+                weight = values.size / points.size
+                for point in points:
+                    acc['digest'].update(float(point), weight)
+            
+            elif acc['categorical']:
+                # Align without sorting so ties keep first-seen order, as value_counts does
+                counts = series.value_counts()
+                index = acc['counts'].index.union(counts.index, sort=False)
+                acc['counts'] = acc['counts'].reindex(index, fill_value=0) + counts.reindex(index, fill_value=0)
+    
+    duplicates = 0
+    if row_hashes:
+        duplicates = rows - np.unique(np.concatenate(row_hashes)).size
+    
+    analysis = {
+        'filepath': str(path),
+        'shape': {
+            'rows': rows,
+            'columns': len(columns)
+        },
+        'columns': {},
+        'missing_values': {col: acc['nulls'] for col, acc in columns.items()},
+        'duplicate_rows': int(duplicates)
+    }
+    
+    for col, acc in columns.items():
+        col_info = {
+            'dtype': str(acc['dtype']),
+            'non_null_count': rows - acc['nulls'],
+            'null_count': acc['nulls'],
+            'null_percentage': round(acc['nulls'] / rows * 100, 2)
+        }
+        
+        if acc['numeric']:
+            count = acc['count']
+            digest = acc['digest']
+            q25 = digest.percentile(25) if count else None
+            q75 = digest.percentile(75) if count else None
+            col_info['statistics'] = {
+                'mean': float(acc['mean']) if count else None,
+                'median': float(digest.percentile(50)) if count else None,
+                'std': float(np.sqrt(acc['m2'] / (count - 1))) if count > 1 else None,
+                'min': float(acc['min']) if count else None,
+                'max': float(acc['max']) if count else None,
+                'q25': float(q25) if count else None,
+                'q75': float(q75) if count else None
+            }
+            
+            # Outlier detection, estimated from the digest's CDF
+            outliers = 0
+            if count:
+                iqr = q75 - q25
+                outside = digest.cdf(q25 - 1.5 * iqr) + 1 - digest.cdf(q75 + 1.5 * iqr)
+                outliers = int(round(count * max(outside, 0.0)))
+            col_info['outliers'] = {
+                'count': outliers,
+                'percentage': round(outliers / rows * 100, 2)
+            }
+        
+        elif acc['categorical']:
+            counts = acc['counts'].sort_values(ascending=False, kind='stable')
+            col_info['unique_count'] = len(counts)
+            col_info['top_values'] = {str(k): int(v) for k, v in counts.head(10).items()}
+        
+        analysis['columns'][col] = col_info
+    
+    return analysis
+
+
+def _filter_mask(target, is_numeric: bool, operator: str, value: str):
+    """
+    Build the row filter used by filter_csv
+    
+    Args:
+        target: Polars column expression or pandas Series to filter on
+        is_numeric: Whether the column holds numbers
+        operator: Comparison operator (==, !=, >, <, >=, <=, contains)
+        value: Value to compare against
+    
+    Returns:
+        Polars expression or pandas boolean mask, or None for an unknown operator
+    """
+    if operator == 'contains':
+        if isinstance(target, pd.Series):
+            strings = target.astype(str)
+            if pa is not None and strings.dtype == object:
+                # Arrow's substring kernel scans the column without a Python call per row
+                strings = strings.astype(pd.ArrowDtype(pa.large_string()))
+                return strings.str.contains(value, regex=False).fillna(False).astype(bool)
+            return strings.str.contains(value, regex=False, na=False)
+        return target.cast(pl.Utf8).str.contains(value, literal=True)
+    
+    compare = _FILTER_OPERATORS.get(operator)
+    if compare is None:
+        return None
+    
+    # Compare numeric columns against the number, not its string form
+    threshold = float(value) if is_numeric or operator not in ('==', '!=') else value
+    if operator == '!=':
+        # Missing cells count as not equal, as numpy NaN does; Polars and
+        # ArrowDtype comparisons would otherwise yield null and drop the row
+        if isinstance(target, pd.Series):
+            return compare(target, threshold).fillna(True).astype(bool)
+        return target.ne_missing(threshold)
+    return compare(target, threshold)
+
+
+def _filter_polars(path: Path, column: str, operator: str, value: str, output: Path = None) -> dict:
+    """
+    Run filter_csv with Polars, pushing the predicate into a lazy CSV scan
+    
+    Without an output file only the row counts and the first 20 matches are
+    collected, so the filtered rows are never materialized.
+    
+    Args:
+        path: Path to the CSV file
+        column: Column name to filter on
+        operator: Comparison operator (==, !=, >, <, >=, <=, contains)
+        value: Value to compare against
+        output: Optional path to save filtered data
+    
+    Returns:
+        filter_csv result dict, or a dict with an 'error' key
+    """
+    cache_path = _parquet_cache(path)
+    if cache_path is not None:
+        lazy_df = pl.scan_parquet(cache_path)
+    else:
+        lazy_df = pl.scan_csv(path, infer_schema_length=None, null_values=_NA_VALUES)
+    schema = lazy_df.collect_schema()
+    
+    if column not in schema:
+        return {'error': f'Column "{column}" not found in CSV'}
+    
+    mask = _filter_mask(pl.col(column), schema[column].is_numeric(), operator, value)
+    if mask is None:
+        return {'error': f'Unknown operator: {operator}'}
+    
+    filtered = lazy_df.filter(mask)
+    if output:
+        filtered_df = filtered.collect()
+        original_rows = lazy_df.select(pl.len()).collect().item()
+        filtered_rows = filtered_df.height
+        sample_df = filtered_df.head(20)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        filtered_df.write_csv(output)
+    else:
+        original, matched, sample_df = pl.collect_all([
+            lazy_df.select(pl.len()),
+            filtered.select(pl.len()),
+            filtered.head(20)
+        ])
+        original_rows = original.item()
+        filtered_rows = matched.item()
+    
+    return {
+        'original_rows': original_rows,
+        'filtered_rows': filtered_rows,
+        'filter': f'{column} {operator} {value}',
+        'sample_data': _records(_pl_to_pandas(sample_df))
+    }
+
+
+def _filter_pandas(path: Path, column: str, operator: str, value: str, output: Path = None) -> dict:
+    """
+    Run filter_csv with pandas, used when Polars is not installed
+    
+    Args:
+        path: Path to the CSV file
+        column: Column name to filter on
+        operator: Comparison operator (==, !=, >, <, >=, <=, contains)
+        value: Value to compare against
+        output: Optional path to save filtered data
+    
+    Returns:
+        filter_csv result dict, or a dict with an 'error' key
+    """
+    df = _read_csv(path)
+    
+    if column not in df.columns:
+        return {'error': f'Column "{column}" not found in CSV'}
+    
+    is_numeric = pd.api.types.is_numeric_dtype(df[column])
+    use_numexpr = (numexpr is not None and is_numeric and isinstance(df[column].dtype, np.dtype)
+                   and operator in _FILTER_OPERATORS and '`' not in column)
+    if use_numexpr:
+        # numexpr (optional, not in requirements.txt) runs the comparison in
+        # multi-threaded vectorized kernels; it only accepts numpy dtypes, so
+        # the Arrow-backed columns pyarrow's reader produces use the mask below
+        filtered_df = df.query(f'`{column}` {operator} @threshold',
+                               local_dict={'threshold': float(value)}, engine='numexpr')
+    else:
+        mask = _filter_mask(df[column], is_numeric, operator, value)
+        if mask is None:
+            return {'error': f'Unknown operator: {operator}'}
+        filtered_df = df[mask]
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        filtered_df.to_csv(output, index=False)
+    
+    return {
+        'original_rows': len(df),
+        'filtered_rows': len(filtered_df),
+        'filter': f'{column} {operator} {value}',
+        'sample_data': _records(filtered_df.head(20))
+    }
+
+
 # ============================================================================
 # TOOLS 
 # ============================================================================
@@ -29,52 +939,24 @@ def list_csv_files(directory: str = ".") -> str:
         path = Path(directory).expanduser().resolve()
         
         if not path.exists():
-            return json.dumps({
+            return _dumps({
                 'error': f'Directory not found: {directory}'
-            }, indent=2)
+            })
         
-        # Find all CSV files
-        csv_files = []
-        for csv_path in path.glob("**/*.csv"):
-            try:
-                # Get basic file info
-                stat = csv_path.stat()
-                
-                # Quick peek at first row for column count
-                with open(csv_path, 'r', encoding='utf-8') as f:
-                    reader = csv.reader(f)
-                    first_row = next(reader, None)
-                    col_count = len(first_row) if first_row else 0
-                
-                # Count rows (approximate)
-                with open(csv_path, 'r', encoding='utf-8') as f:
-                    row_count = sum(1 for _ in f) - 1  # Subtract header
-                
-                csv_files.append({
-                    'name': csv_path.name,
-                    'path': str(csv_path),
-                    'size_mb': round(stat.st_size / (1024 * 1024), 2),
-                    'rows': row_count,
-                    'columns': col_count,
-                    'modified': stat.st_mtime
-                })
-            except Exception as e:
-                csv_files.append({
-                    'name': csv_path.name,
-                    'path': str(csv_path),
-                    'error': str(e)
-                })
-        
-        return json.dumps({
+        # Find all CSV files and inspect them concurrently; the reads release the GIL
+        with ThreadPoolExecutor(max_workers=_LIST_WORKERS) as executor:
+            csv_files = list(executor.map(_inspect_csv, _walk_csv(str(path))))
+        
+        return _dumps({
             'directory': str(path),
             'csv_files': csv_files,
             'total_files': len(csv_files)
-        }, indent=2)
+        })
     
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'error': str(e)
-        }, indent=2)
+        })
 
 
 @mcp.tool()
@@ -93,25 +975,25 @@ def read_csv(filepath: str, rows: int = 100) -> str:
         path = Path(filepath).expanduser().resolve()
         
         if not path.exists():
-            return json.dumps({
+            return _dumps({
                 'error': f'File not found: {filepath}'
-            }, indent=2)
+            })
         
         # Read CSV
-        df = pd.read_csv(path, nrows=rows)
+        df = _read_csv(path, nrows=rows)
         
-        return json.dumps({
+        return _dumps({
             'filepath': str(path),
             'total_rows': len(df),
             'columns': df.columns.tolist(),
-            'data': df.to_dict(orient='records')
-        }, indent=2)
+            'data': _records(df)
+        })
     
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'error': str(e),
             'filepath': filepath
-        }, indent=2)
+        })
 
 
 @mcp.tool()
@@ -133,27 +1015,22 @@ def write_csv(filepath: str, data: List[List[Any]], headers: List[str] = None) -
         # Create parent directories if they don't exist
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Create DataFrame
-        if headers:
-            df = pd.DataFrame(data, columns=headers)
-        else:
-            df = pd.DataFrame(data)
+        # Write to CSV; without headers, number the columns as pandas did
+        width = len(headers) if headers else max((len(row) for row in data), default=0)
+        _write_rows(path, data, width, header=headers or list(range(width)))
         
-        # Write to CSV
-        df.to_csv(path, index=False)
-        
-        return json.dumps({
+        return _dumps({
             'status': 'success',
             'filepath': str(path),
-            'rows_written': len(df),
-            'columns_written': len(df.columns)
-        }, indent=2)
+            'rows_written': len(data),
+            'columns_written': width
+        })
     
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'error': str(e),
             'filepath': filepath
-        }, indent=2)
+        })
 
 
 @mcp.tool()
@@ -172,30 +1049,33 @@ def append_csv(filepath: str, data: List[List[Any]]) -> str:
         path = Path(filepath).expanduser().resolve()
         
         if not path.exists():
-            return json.dumps({
+            return _dumps({
                 'error': f'File not found: {filepath}. Use write_csv to create a new file.'
-            }, indent=2)
+            })
         
-        # Read existing CSV to get headers
-        existing_df = pd.read_csv(path)
+        # Read only the header row of the existing CSV
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            header = next(csv.reader(f), None)
         
-        # Create DataFrame with same columns
-        new_df = pd.DataFrame(data, columns=existing_df.columns)
+        if not header:
+            return _dumps({
+                'error': f'No header row found in {filepath}. Use create_csv to add headers.'
+            })
         
         # Append to CSV
-        new_df.to_csv(path, mode='a', header=False, index=False)
+        _write_rows(path, data, len(header), mode='a')
         
-        return json.dumps({
+        return _dumps({
             'status': 'success',
             'filepath': str(path),
-            'rows_appended': len(new_df)
-        }, indent=2)
+            'rows_appended': len(data)
+        })
     
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'error': str(e),
             'filepath': filepath
-        }, indent=2)
+        })
 
 
 @mcp.tool()
@@ -222,18 +1102,18 @@ def create_csv(filepath: str, headers: List[str]) -> str:
         # Write to CSV
         df.to_csv(path, index=False)
         
-        return json.dumps({
+        return _dumps({
             'status': 'success',
             'filepath': str(path),
             'headers': headers,
             'message': f'Created new CSV file with {len(headers)} columns'
-        }, indent=2)
+        })
     
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'error': str(e),
             'filepath': filepath
-        }, indent=2)
+        })
 
 
 @mcp.tool()
@@ -251,12 +1131,12 @@ def get_csv_info(filepath: str) -> str:
         path = Path(filepath).expanduser().resolve()
         
         if not path.exists():
-            return json.dumps({
+            return _dumps({
                 'error': f'File not found: {filepath}'
-            }, indent=2)
+            })
         
         # Read CSV
-        df = pd.read_csv(path)
+        df = _read_csv(path)
         
         # Get file stats
         stat = path.stat()
@@ -275,13 +1155,13 @@ def get_csv_info(filepath: str) -> str:
             'memory_usage_mb': round(df.memory_usage(deep=True).sum() / (1024 * 1024), 2)
         }
         
-        return json.dumps(info, indent=2)
+        return _dumps(info)
     
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'error': str(e),
             'filepath': filepath
-        }, indent=2)
+        })
 
 
 @mcp.tool()
@@ -299,12 +1179,16 @@ def analyze_csv(filepath: str) -> str:
         path = Path(filepath).expanduser().resolve()
         
         if not path.exists():
-            return json.dumps({
+            return _dumps({
                 'error': f'File not found: {filepath}'
-            }, indent=2)
+            })
+        
+        # Stream very large files instead of loading them whole
+        if TDigest is not None and path.stat().st_size > _CHUNKED_ANALYSIS_BYTES:
+            return _dumps(_analyze_chunked(path))
         
         # Read CSV
-        df = pd.read_csv(path)
+        df = _read_csv(path)
         
         analysis = {
             'filepath': str(path),
@@ -314,55 +1198,44 @@ def analyze_csv(filepath: str) -> str:
             },
             'columns': {},
             'missing_values': df.isnull().sum().to_dict(),
-            'duplicate_rows': int(df.duplicated().sum())
+            'duplicate_rows': _count_duplicates(df)
         }
         
         # Analyze each column
         for col in df.columns:
+            series = df[col]
+            nulls = int(series.isna().sum())
             col_info = {
-                'dtype': str(df[col].dtype),
-                'non_null_count': int(df[col].count()),
-                'null_count': int(df[col].isnull().sum()),
-                'null_percentage': round(df[col].isnull().sum() / len(df) * 100, 2)
+                'dtype': str(series.dtype),
+                'non_null_count': len(df) - nulls,
+                'null_count': nulls,
+                'null_percentage': round(nulls / len(df) * 100, 2)
             }
             
             # Numeric column analysis
-            if pd.api.types.is_numeric_dtype(df[col]):
-                col_info['statistics'] = {
-                    'mean': float(df[col].mean()) if not pd.isna(df[col].mean()) else None,
-                    'median': float(df[col].median()) if not pd.isna(df[col].median()) else None,
-                    'std': float(df[col].std()) if not pd.isna(df[col].std()) else None,
-                    'min': float(df[col].min()) if not pd.isna(df[col].min()) else None,
-                    'max': float(df[col].max()) if not pd.isna(df[col].max()) else None,
-                    'q25': float(df[col].quantile(0.25)) if not pd.isna(df[col].quantile(0.25)) else None,
-                    'q75': float(df[col].quantile(0.75)) if not pd.isna(df[col].quantile(0.75)) else None
-                }
-                
-                # Outlier detection
-                Q1 = df[col].quantile(0.25)
-                Q3 = df[col].quantile(0.75)
-                IQR = Q3 - Q1
-                outliers = df[col][(df[col] < Q1 - 1.5 * IQR) | (df[col] > Q3 + 1.5 * IQR)]
+            if pd.api.types.is_numeric_dtype(series):
+                col_info['statistics'], outliers = _numeric_summary(series)
                 col_info['outliers'] = {
-                    'count': len(outliers),
-                    'percentage': round(len(outliers) / len(df) * 100, 2)
+                    'count': outliers,
+                    'percentage': round(outliers / len(df) * 100, 2)
                 }
             
             # Categorical column analysis
-            elif pd.api.types.is_object_dtype(df[col]) or pd.api.types.is_categorical_dtype(df[col]):
-                value_counts = df[col].value_counts().head(10)
-                col_info['unique_count'] = int(df[col].nunique())
+            elif _is_categorical(series):
+                value_counts = series.value_counts()
+                col_info['unique_count'] = len(value_counts)
+                value_counts = value_counts.head(10)
                 col_info['top_values'] = {str(k): int(v) for k, v in value_counts.items()}
             
             analysis['columns'][col] = col_info
         
-        return json.dumps(analysis, indent=2)
+        return _dumps(analysis)
     
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'error': str(e),
             'filepath': filepath
-        }, indent=2)
+        })
 
 @mcp.tool()
 def categorize_by_product(filepath: str, categories_filepath: str = "test_data/product_categories.csv") -> str:
@@ -380,15 +1253,15 @@ def categorize_by_product(filepath: str, categories_filepath: str = "test_data/p
         # Resolve file paths
         queries_path = Path(filepath).expanduser().resolve()
         if not queries_path.exists():
-            return json.dumps({
+            return _dumps({
                 'error': f'Queries file not found: {filepath}'
-            }, indent=2)
+            })
 
         categories_path = Path(categories_filepath).expanduser().resolve()
         if not categories_path.exists():
-            return json.dumps({
+            return _dumps({
                 'error': f'Categories file not found: {categories_filepath}'
-            }, indent=2)
+            })
         
         # Load data
         queries_df = pd.read_csv(queries_path)
@@ -396,16 +1269,16 @@ def categorize_by_product(filepath: str, categories_filepath: str = "test_data/p
         
         # Check if 'query' column exists
         if 'query' not in queries_df.columns:
-            return json.dumps({
+            return _dumps({
                 'error': 'CSV file must contain a "query" column'
-            }, indent=2)
+            })
         
         # Validate categories file columns
         if not {'product_area', 'keywords'}.issubset(set(categories_df.columns)):
-            return json.dumps({
+            return _dumps({
                 'error': 'Categories CSV must contain columns: product_area, keywords',
                 'found_columns': categories_df.columns.tolist()
-            }, indent=2)
+            })
         
         # Build keyword mapping from categories CSV
         category_keywords = {}
@@ -419,38 +1292,44 @@ def categorize_by_product(filepath: str, categories_filepath: str = "test_data/p
                 category_keywords[product_area] = keywords
         
         if not category_keywords:
-            return json.dumps({
+            return _dumps({
                 'error': 'No keywords found in categories CSV',
                 'categories_filepath': str(categories_path)
-            }, indent=2)
+            })
         
-        def categorize_query(query_text: Any) -> str:
-            """Categorize a single query based on keyword matching from CSV."""
-            if pd.isna(query_text):
-                return 'Uncategorized'
+        # Index categories by keyword so each query is scanned only once
+        keyword_categories = {}
+        for category, keywords in category_keywords.items():
+            for keyword in keywords:
+                keyword_categories.setdefault(keyword, []).append(category)
+        find_keywords = _keyword_matcher(list(keyword_categories))
+        
+        def categorize_query(query_lower: str) -> str:
+            """Categorize a single lowercased query based on keyword matching from CSV."""
+            scores = {}
+            for keyword in find_keywords(query_lower):
+                # Basic scoring: count matches; longer keywords are weighted slightly higher
+                weight = 2 if len(keyword) >= 8 else 1
+                for category in keyword_categories[keyword]:
+                    scores[category] = scores.get(category, 0) + weight
             
-            query_lower = str(query_text).lower()
+            # Ties go to the category listed first in the CSV
             best_category = 'Uncategorized'
             best_score = 0
-            
-            for category, keywords in category_keywords.items():
-                score = 0
-                for keyword in keywords:
-                    if not keyword:
-                        continue
-                    if keyword in query_lower:
-                        # Basic scoring: count matches; longer keywords are weighted slightly higher
-                        score += 1
-                        if len(keyword) >= 8:
-                            score += 1
-                if score > best_score:
-                    best_score = score
+            for category in category_keywords:
+                if scores.get(category, 0) > best_score:
+                    best_score = scores[category]
                     best_category = category
             
             return best_category
         
-        # Apply categorization to all queries
-        queries_df['product_category'] = queries_df['query'].apply(categorize_query)
+        # Apply categorization to all queries, lowercasing them in one vectorized pass
+        # and filling a raw object array to skip per-row pandas overhead
+        queries_lower = queries_df['query'].fillna('').astype(str).str.lower().to_numpy()
+        categories = np.empty(len(queries_lower), dtype=object)
+        for i in range(len(queries_lower)):
+            categories[i] = categorize_query(queries_lower[i])
+        queries_df['product_category'] = categories
         
         # Build output filename (same folder, with "_categorized" appended)
         output_path = queries_path.with_name(
@@ -477,14 +1356,14 @@ def categorize_by_product(filepath: str, categories_filepath: str = "test_data/p
             # 'categorized_data': queries_df[['query', 'product_category']].to_dict('records')
         }
         
-        return json.dumps(results, indent=2)
+        return _dumps(results)
     
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'error': str(e),
             'filepath': filepath,
             'categories_filepath': categories_filepath
-        }, indent=2)
+        })
         
 @mcp.tool()
 def filter_csv(filepath: str, column: str, operator: str, value: str, 
@@ -506,58 +1385,29 @@ def filter_csv(filepath: str, column: str, operator: str, value: str,
         path = Path(filepath).expanduser().resolve()
         
         if not path.exists():
-            return json.dumps({
+            return _dumps({
                 'error': f'File not found: {filepath}'
-            }, indent=2)
+            })
         
-        df = pd.read_csv(path)
-        
-        if column not in df.columns:
-            return json.dumps({
-                'error': f'Column "{column}" not found in CSV'
-            }, indent=2)
+        output = Path(output_path).expanduser().resolve() if output_path else None
         
         # Apply filter
-        if operator == '==':
-            filtered_df = df[df[column] == value]
-        elif operator == '!=':
-            filtered_df = df[df[column] != value]
-        elif operator == '>':
-            filtered_df = df[df[column] > float(value)]
-        elif operator == '<':
-            filtered_df = df[df[column] < float(value)]
-        elif operator == '>=':
-            filtered_df = df[df[column] >= float(value)]
-        elif operator == '<=':
-            filtered_df = df[df[column] <= float(value)]
-        elif operator == 'contains':
-            filtered_df = df[df[column].astype(str).str.contains(value, na=False)]
+        if pl is not None:
+            result = _filter_polars(path, column, operator, value, output)
         else:
-            return json.dumps({
-                'error': f'Unknown operator: {operator}'
-            }, indent=2)
-        
-        result = {
-            'original_rows': len(df),
-            'filtered_rows': len(filtered_df),
-            'filter': f'{column} {operator} {value}',
-            'sample_data': filtered_df.head(20).to_dict(orient='records')
-        }
+            result = _filter_pandas(path, column, operator, value, output)
         
-        # Save to file if output path provided
-        if output_path:
-            output = Path(output_path).expanduser().resolve()
-            output.parent.mkdir(parents=True, exist_ok=True)
-            filtered_df.to_csv(output, index=False)
+        # Report where the filtered data was saved
+        if output and 'error' not in result:
             result['output_path'] = str(output)
         
-        return json.dumps(result, indent=2)
+        return _dumps(result)
     
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'error': str(e),
             'filepath': filepath
-        }, indent=2)
+        })
 
 
 @mcp.tool()
@@ -581,38 +1431,64 @@ def merge_csvs(filepath1: str, filepath2: str, output_path: str,
         path2 = Path(filepath2).expanduser().resolve()
         
         if not path1.exists():
-            return json.dumps({'error': f'File not found: {filepath1}'}, indent=2)
+            return _dumps({'error': f'File not found: {filepath1}'})
         if not path2.exists():
-            return json.dumps({'error': f'File not found: {filepath2}'}, indent=2)
+            return _dumps({'error': f'File not found: {filepath2}'})
         
-        df1 = pd.read_csv(path1)
-        df2 = pd.read_csv(path2)
-        
-        # Merge DataFrames
-        if on:
-            merged_df = pd.merge(df1, df2, on=on, how=how)
-        else:
-            merged_df = pd.merge(df1, df2, how=how)
-        
-        # Save merged data
         output = Path(output_path).expanduser().resolve()
         output.parent.mkdir(parents=True, exist_ok=True)
-        merged_df.to_csv(output, index=False)
         
-        return json.dumps({
+        input_bytes = path1.stat().st_size + path2.stat().st_size
+        if duckdb is not None and how in _DUCKDB_JOIN_TYPES and input_bytes >= _DUCKDB_MERGE_BYTES:
+            file1_rows, file2_rows, merged_rows = _merge_duckdb(path1, path2, output, on, how)
+        elif pl is not None and how in _POLARS_JOIN_TYPES:
+            df1 = pl.read_csv(path1, infer_schema_length=None, null_values=_NA_VALUES)
+            df2 = pl.read_csv(path2, infer_schema_length=None, null_values=_NA_VALUES)
+            
+            # Like pd.merge, default to joining on the shared columns
+            keys = [on] if on else [col for col in df1.columns if col in df2.columns]
+            if not keys:
+                return _dumps({'error': 'No common columns to perform merge on'})
+            
+            # Suffix the other shared columns _x/_y and coalesce keys as pandas does
+            overlap = [col for col in df1.columns if col in df2.columns and col not in keys]
+            df1 = df1.rename({col: f'{col}_x' for col in overlap})
+            df2 = df2.rename({col: f'{col}_y' for col in overlap})
+            merged_df = df1.join(df2, on=keys, how=_POLARS_JOIN_TYPES[how], coalesce=True)
+            merged_df = merged_df.select(df1.columns + [col for col in df2.columns if col not in keys])
+            if how == 'outer':
+                # pd.merge sorts outer join keys lexicographically
+                merged_df = merged_df.sort(keys, nulls_last=True, maintain_order=True)
+            merged_df.write_csv(output)
+            file1_rows, file2_rows, merged_rows = len(df1), len(df2), len(merged_df)
+        else:
+            df1 = pd.read_csv(path1)
+            df2 = pd.read_csv(path2)
+            
+            # Merge DataFrames
+            if on:
+                merged_df = pd.merge(df1, df2, on=on, how=how)
+            else:
+                merged_df = pd.merge(df1, df2, how=how)
+            
+            # Save merged data
+            merged_df.to_csv(output, index=False)
+            file1_rows, file2_rows, merged_rows = len(df1), len(df2), len(merged_df)
+        
+        return _dumps({
             'status': 'success',
-            'file1_rows': len(df1),
-            'file2_rows': len(df2),
-            'merged_rows': len(merged_df),
+            'file1_rows': file1_rows,
+            'file2_rows': file2_rows,
+            'merged_rows': merged_rows,
             'output_path': str(output),
             'merge_type': how,
             'merge_on': on
-        }, indent=2)
+        })
     
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             'error': str(e)
-        }, indent=2)
+        })
 
 
 
@@ -638,7 +1514,7 @@ def get_csv_resource(filepath: str) -> str:
         if not path.exists():
             return f"Error: File not found: {filepath}"
         
-        df = pd.read_csv(path)
+        df = _read_csv(path)
         
         # Format as readable text
         output = []
@@ -651,8 +1527,8 @@ def get_csv_resource(filepath: str) -> str:
         output.append("-" * 80)
         
         # Add data rows (first 50)
-        for _, row in df.head(50).iterrows():
-            output.append(" | ".join(str(val) for val in row))
+        for row in df.head(50).to_numpy(dtype=object):
+            output.append(" | ".join(map(str, row)))
         
         if len(df) > 50:
             output.append(f"... and {len(df) - 50} more rows")